@@ -1,27 +1,270 @@
 import os
+import atexit
+import heapq
 import re
 import socket
+import struct
 import platform
 import subprocess
-import psutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict
+
+try:
+    import psutil
+except Exception:
+    psutil = None
+
+# POSIX only; main.py imports this module on every platform
+try:
+    import fcntl
+except Exception:
+    fcntl = None
+
+try:
+    import pynvml
+except Exception:
+    pynvml = None
+
+# filesystems worth reporting in the /proc/mounts fallback; everything else
+# (tmpfs, cgroup, overlay, proc, ...) is skipped before calling statvfs
+_REAL_FS = frozenset({"ext2", "ext3", "ext4", "xfs", "btrfs", "zfs", "vfat", "exfat", "ntfs", "ntfs3", "f2fs"})
+
+_SIOCGIFADDR = 0x8915
+
+_VGA_RE = re.compile(rb"\b(VGA|3D)\b", re.IGNORECASE)
+
+def _read_small(path: str, size: int = 128) -> Optional[bytes]:
+    # tiny sysfs/procfs files: skip the buffered file object and read raw
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, size).strip()
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+def _full_process_name(pid: int, name: str) -> str:
+    # comm is cut to 15 characters by the kernel; like psutil's name(),
+    # recover the full name from the executable in cmdline when it matches
+    if len(name) != 15:
+        return name
+    cmdline = _read_small(f"/proc/{pid}/cmdline", 4096)
+    if not cmdline:
+        return name
+    exe = os.path.basename(cmdline.split(b"\0", 1)[0].decode(errors="replace"))
+    return exe if exe.startswith(name) else name
+
+def _parse_cpuinfo_block(block: str) -> dict:
+    return {
+        key.strip().lower(): value.strip()
+        for key, sep, value in (line.partition(":") for line in block.splitlines())
+        if sep
+    }
+
+def _read_proc_cpuinfo() -> dict:
+    # processor blocks are separated by blank lines; only the first is parsed
+    with open("/proc/cpuinfo", "rb") as fh:
+        data = fh.read()
+    return _parse_cpuinfo_block(data.split(b"\n\n", 1)[0].decode(errors="ignore"))
 
 class Linux:
     def __init__(self):
-        pass
-    def gather_info(self) -> dict:
+        self._hostname = platform.node() or ""
+        self._gpu_model = self._get_gpu_model()
+        self._ip = self._discover_ip()
+        # NVML handle for GPU telemetry without spawning nvidia-smi per poll;
+        # nvidia-smi stays as the fallback
+        self._nvml_handle = None
+        if pynvml:
+            try:
+                pynvml.nvmlInit()
+                atexit.register(pynvml.nvmlShutdown)
+                self._nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            except Exception:
+                self._nvml_handle = None
+        # host metadata that does not change while the client is running;
+        # read it once here and merge it into every gather_info() result
+        self._static = self._collect_static_once()
+        # prime psutil's cpu_percent baseline so gather_info never has to block
+        self._cpu_percent_ts = time.monotonic()
+        if psutil:
+            try:
+                psutil.cpu_percent(interval=None)
+            except Exception:
+                pass
+        # reused across polls so worker threads are not respawned every time
+        self._executor = ThreadPoolExecutor(max_workers=6)
+
+    def _get_os_release(self) -> tuple:
+        # OS info from /etc/os-release (KEY=value lines, values optionally quoted)
+        try:
+            with open("/etc/os-release", "r") as fh:
+                fields = {}
+                for line in fh.read().splitlines():
+                    key, sep, value = line.partition("=")
+                    if sep:
+                        fields[key.strip()] = value.strip().strip('"\'')
+            return fields.get("NAME", ""), fields.get("VERSION", "")
+        except Exception:
+            return "", ""
+
+    def _get_uname(self) -> tuple:
+        try:
+            uname = platform.uname()
+            return uname.release or "", uname.machine or ""
+        except Exception:
+            return "", ""
+
+    def _get_cpu_model(self) -> str:
+        # cpu model from the first processor block of /proc/cpuinfo
+        try:
+            first = _read_proc_cpuinfo()
+        except Exception:
+            return ""
+        return first.get("model name") or first.get("cpu model") or ""
+
+    def _get_memory_max(self) -> int:
+        try:
+            if psutil:
+                return int(psutil.virtual_memory().total)
+        except Exception:
+            pass
+        return 0
+
+    def _get_boot_time(self) -> int:
+        try:
+            if psutil:
+                return int(psutil.boot_time())
+        except Exception:
+            pass
+        return 0
+
+    def _get_gpu_model(self) -> Optional[str]:
+        # model-only fallback for hosts without nvidia-smi
+        try:
+            lspci = subprocess.check_output(["lspci", "-mm"], stderr=subprocess.DEVNULL, timeout=1.0)
+            # look for VGA/3D controller line, only decoding the match
+            for raw in lspci.splitlines():
+                if _VGA_RE.search(raw):
+                    line = raw.decode(errors="ignore")
+                    # format can be like: "00:02.0" "VGA compatible controller" "Intel Corporation" "HD Graphics 620"
+                    parts = [p.strip('" ') for p in line.split("\t") if p.strip()]
+                    if parts:
+                        return parts[-1]
+        except Exception:
+            pass
+        return None
+
+    def _spawn_nvidia_smi(self) -> Optional[subprocess.Popen]:
+        try:
+            return subprocess.Popen(
+                [
+                    "nvidia-smi",
+                    "--query-gpu=utilization.gpu,clocks.current.graphics,temperature.gpu,name",
+                    "--format=csv,noheader,nounits",
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except Exception:
+            return None
+
+    def _reap_nvidia_smi(self, proc: Optional[subprocess.Popen]) -> dict:
+        info = {"usage": None, "frequency": None, "temperature": None, "model": None}
+        if proc is None:
+            return info
+        try:
+            out, _ = proc.communicate(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            return info
+        except Exception:
+            return info
+        if proc.returncode != 0:
+            return info
+        out = out.decode(errors="ignore").strip()
+        if out:
+            # take first GPU line
+            first = out.splitlines()[0]
+            parts = [p.strip() for p in first.split(",")]
+            if len(parts) >= 4:
+                try:
+                    info["usage"] = float(parts[0])
+                except Exception:
+                    info["usage"] = None
+                try:
+                    info["frequency"] = float(parts[1])
+                except Exception:
+                    info["frequency"] = None
+                try:
+                    info["temperature"] = float(parts[2])
+                except Exception:
+                    info["temperature"] = None
+                info["model"] = parts[3] if parts[3] else None
+        return info
+
+    def _get_gpu_via_nvml(self) -> Dict[str, Optional[float or str]]:
+        info = {"usage": None, "frequency": None, "temperature": None, "model": None}
+        try:
+            info["usage"] = float(pynvml.nvmlDeviceGetUtilizationRates(self._nvml_handle).gpu)
+        except Exception:
+            pass
+        try:
+            info["frequency"] = float(pynvml.nvmlDeviceGetClockInfo(self._nvml_handle, pynvml.NVML_CLOCK_GRAPHICS))
+        except Exception:
+            pass
+        try:
+            info["temperature"] = float(pynvml.nvmlDeviceGetTemperature(self._nvml_handle, pynvml.NVML_TEMPERATURE_GPU))
+        except Exception:
+            pass
         try:
-            import psutil
+            name = pynvml.nvmlDeviceGetName(self._nvml_handle)
+            # older pynvml releases return bytes
+            info["model"] = (name.decode(errors="ignore") if isinstance(name, bytes) else str(name)) or None
         except Exception:
-            psutil = None
+            pass
+        return info
+
+    def _get_gpu(self) -> tuple:
+        # GPU info (best-effort using nvidia-smi, fallback for model only)
+        if self._nvml_handle is not None:
+            info = self._get_gpu_via_nvml()
+        else:
+            info = self._reap_nvidia_smi(self._spawn_nvidia_smi())
+        gpu_model = info["model"]
+        if gpu_model is None:
+            gpu_model = self._gpu_model
+        return info["usage"], info["frequency"], info["temperature"], gpu_model
 
-        # hostname
-        hostname = platform.node() or ""
+    def _discover_ip(self) -> str:
+        # address of the interface holding the default route, read from
+        # /proc/net/route + SIOCGIFADDR without sending any traffic
+        try:
+            iface = None
+            with open("/proc/net/route", "r") as fh:
+                next(fh, None)  # header
+                for line in fh:
+                    fields = line.split()
+                    if len(fields) > 1 and fields[1] == "00000000":
+                        iface = fields[0]
+                        break
+            if iface and fcntl:
+                with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                    ifreq = fcntl.ioctl(s.fileno(), _SIOCGIFADDR, struct.pack("256s", iface[:15].encode()))
+                return socket.inet_ntoa(ifreq[20:24])
+        except Exception:
+            pass
 
-        # ip (best-effort, non-blocking)
+        # fallback: let the kernel pick the outgoing iface for a UDP "connect"
         ip = "127.0.0.1"
         try:
             s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.settimeout(0.5)
+            s.settimeout(0.1)
             try:
                 s.connect(("8.8.8.8", 80))
                 ip = s.getsockname()[0]
@@ -29,16 +272,30 @@ class Linux:
                 s.close()
         except Exception:
             try:
-                ip = socket.gethostbyname(hostname)
+                ip = socket.gethostbyname(self._hostname)
             except Exception:
                 ip = "127.0.0.1"
+        return ip
 
-        # cpu usage & frequency
+    def _get_ip(self) -> str:
+        # the primary address is cached; only retry discovery while it failed
+        if self._ip.startswith("127."):
+            self._ip = self._discover_ip()
+        return self._ip
+
+    def _get_cpu_usage_freq(self) -> tuple:
         cpu_usage = None
         cpu_frequency = None
         try:
             if psutil:
-                cpu_usage = float(psutil.cpu_percent(interval=0.5))
+                # non-blocking: usage since the previous call (the first poll
+                # measures from the priming call in __init__). Only sample
+                # for a short interval when polled again too quickly for the
+                # delta to be meaningful.
+                now = time.monotonic()
+                interval = 0.1 if now - self._cpu_percent_ts < 0.1 else None
+                cpu_usage = float(psutil.cpu_percent(interval=interval))
+                self._cpu_percent_ts = time.monotonic()
                 cpu_freq = psutil.cpu_freq()
                 cpu_frequency = float(cpu_freq.current) if cpu_freq and cpu_freq.current else None
             else:
@@ -46,7 +303,9 @@ class Linux:
         except Exception:
             cpu_usage = None
             cpu_frequency = None
+        return cpu_usage, cpu_frequency
 
+    def _get_cpu_temperature(self) -> Optional[float]:
         # cpu temperature (best-effort)
         cpu_temperature = None
         try:
@@ -65,94 +324,28 @@ class Linux:
                             break
             if cpu_temperature is None:
                 # fallback to sysfs thermal zones
-                tz_base = "/sys/class/thermal"
-                if os.path.isdir(tz_base):
-                    for name in sorted(os.listdir(tz_base)):
-                        if name.startswith("thermal_zone"):
-                            p = os.path.join(tz_base, name, "temp")
-                            try:
-                                with open(p, "r") as fh:
-                                    raw = fh.read().strip()
-                                    if raw:
-                                        val = float(raw)
-                                        # many sensors report millidegrees
-                                        if val > 1000:
-                                            val = val / 1000.0
-                                        cpu_temperature = float(val)
-                                        break
-                            except Exception:
-                                continue
-        except Exception:
-            cpu_temperature = None
-
-        # GPU info (best-effort using nvidia-smi, fallback for model only)
-        gpu_usage = None
-        gpu_frequency = None
-        gpu_temperature = None
-        gpu_model = None
-        try:
-            out = subprocess.check_output(
-                [
-                    "nvidia-smi",
-                    "--query-gpu=utilization.gpu,clocks.current.graphics,temperature.gpu,name",
-                    "--format=csv,noheader,nounits",
-                ],
-                stderr=subprocess.DEVNULL,
-                timeout=1.0,
-            ).decode(errors="ignore").strip()
-            if out:
-                # take first GPU line
-                first = out.splitlines()[0]
-                parts = [p.strip() for p in first.split(",")]
-                if len(parts) >= 4:
-                    try:
-                        gpu_usage = float(parts[0])
-                    except Exception:
-                        gpu_usage = None
-                    try:
-                        gpu_frequency = float(parts[1])
-                    except Exception:
-                        gpu_frequency = None
+                try:
+                    zones = sorted(e.path for e in os.scandir("/sys/class/thermal") if e.name.startswith("thermal_zone"))
+                except OSError:
+                    zones = []
+                for zone in zones:
+                    raw = _read_small(f"{zone}/temp")
+                    if not raw:
+                        continue
                     try:
-                        gpu_temperature = float(parts[2])
-                    except Exception:
-                        gpu_temperature = None
-                    gpu_model = parts[3] if parts[3] else None
-        except Exception:
-            # attempt to get model via lspci
-            try:
-                lspci = subprocess.check_output(["lspci", "-mm"], stderr=subprocess.DEVNULL, timeout=1.0).decode(errors="ignore")
-                # look for VGA/3D controller line
-                for line in lspci.splitlines():
-                    if re.search(r"\b(VGA|3D)\b", line, re.IGNORECASE):
-                        # format can be like: "00:02.0" "VGA compatible controller" "Intel Corporation" "HD Graphics 620"
-                        parts = [p.strip('" ') for p in line.split("\t") if p.strip()]
-                        if parts:
-                            gpu_model = parts[-1]
-                            break
-            except Exception:
-                gpu_model = None
-
-        # memory
-        memory_usage = None
-        memory_max = None
-        try:
-            if psutil:
-                vm = psutil.virtual_memory()
-                memory_usage = float(vm.percent)
-                memory_max = float(vm.total)
-            else:
-                memory_usage = None
-                memory_max = None
+                        val = int(raw)
+                    except ValueError:
+                        continue
+                    # many sensors report millidegrees
+                    cpu_temperature = val / 1000.0 if val > 1000 else float(val)
+                    break
         except Exception:
-            memory_usage = None
-            memory_max = None
+            cpu_temperature = None
+        return cpu_temperature
 
-        # disk
+    def _get_disks(self) -> list:
         disks = []
         try:
-            disk_usage = None
-            disk_size = None
             if psutil:
                 # enumerate partitions via psutil
                 try:
@@ -162,9 +355,14 @@ class Linux:
                 seen = set()
                 for part in parts:
                     mp = part.mountpoint
-                    if mp in seen:
+                    # bind mounts share st_dev with their source, count them once
+                    try:
+                        dev = os.stat(mp).st_dev
+                    except OSError:
                         continue
-                    seen.add(mp)
+                    if dev in seen:
+                        continue
+                    seen.add(dev)
                     try:
                         du = psutil.disk_usage(mp)
                         disks.append({
@@ -185,23 +383,24 @@ class Linux:
                         })
                     except Exception:
                         pass
-                if disks:
-                    disk_usage = disks[0]["usage"]
-                    disk_size = disks[0]["size"]
             else:
-                # fallback: parse /proc/mounts and use os.statvfs
+                # fallback: parse /proc/mounts and use os.statvfs on real
+                # filesystems only, one mountpoint per device
                 try:
-                    mounts = set()
+                    mounts = {}
                     with open("/proc/mounts", "r") as fh:
                         for line in fh:
                             parts = line.split()
-                            if len(parts) >= 2:
-                                mounts.add(parts[1])
-                    for mp in sorted(mounts):
-                        # skip obvious pseudo filesystems
-                        if mp.startswith(("/proc", "/sys")):
-                            continue
+                            if len(parts) < 3 or parts[2] not in _REAL_FS or parts[0] in mounts:
+                                continue
+                            mounts[parts[0]] = parts[1]
+                    seen = set()
+                    for mp in sorted(mounts.values()):
                         try:
+                            dev = os.stat(mp).st_dev
+                            if dev in seen:
+                                continue
+                            seen.add(dev)
                             st = os.statvfs(mp)
                             total = st.f_blocks * st.f_frsize
                             free = st.f_bfree * st.f_frsize
@@ -214,97 +413,105 @@ class Linux:
                             })
                         except Exception:
                             continue
-                    if disks:
-                        disk_usage = disks[0]["usage"]
-                        disk_size = disks[0]["size"]
                 except Exception:
                     pass
-
         except Exception:
             disks = []
+        return disks
 
+    def _get_processes(self) -> list:
         # processes - top 10 by RSS memory (name + pid)
-        processes = []
+        # reads /proc/<pid>/statm (resident pages) and comm directly and keeps
+        # a size-10 min-heap, instead of building and sorting every process
+        top = []
         try:
-            if psutil:
-                procs = []
-                for p in psutil.process_iter(attrs=["name", "pid", "memory_info"]):
+            with os.scandir("/proc") as it:
+                for entry in it:
+                    pid = entry.name
+                    if not pid.isdigit():
+                        continue
+                    statm = _read_small(f"/proc/{pid}/statm", 64)
+                    if not statm:
+                        continue
                     try:
-                        info = p.info
-                        rss = info.get("memory_info").rss if info.get("memory_info") else 0
-                        name = info.get("name") or f"pid:{info.get('pid')}"
-                        procs.append((rss, f"{name} ({info.get('pid')})"))
-                    except Exception:
+                        rss = int(statm.split(None, 2)[1])
+                    except (IndexError, ValueError):
                         continue
-                procs.sort(key=lambda x: x[0], reverse=True)
-                processes = [p[1] for p in procs[:10]]
-        except Exception:
-            processes = []
+                    if len(top) == 10 and rss <= top[0][0]:
+                        continue
+                    comm = _read_small(f"/proc/{pid}/comm", 64)
+                    name = comm.decode(errors="replace") if comm else f"pid:{pid}"
+                    item = (rss, int(pid), name)
+                    if len(top) < 10:
+                        heapq.heappush(top, item)
+                    else:
+                        heapq.heappushpop(top, item)
+        except OSError:
+            return []
+        return [f"{_full_process_name(pid, name)} ({pid})" for _, pid, name in sorted(top, reverse=True)]
 
-        # OS info from /etc/os-release and platform
-        os_name = ""
-        os_version = ""
-        try:
-            if os.path.exists("/etc/os-release"):
-                with open("/etc/os-release", "r") as fh:
-                    data = fh.read()
-                m_name = re.search(r'^NAME="?([^"\n]+)"?', data, flags=re.M)
-                m_ver = re.search(r'^VERSION="?([^"\n]+)"?', data, flags=re.M)
-                if m_name:
-                    os_name = m_name.group(1)
-                if m_ver:
-                    os_version = m_ver.group(1)
-        except Exception:
-            os_name = ""
-            os_version = ""
+    def _collect_static_once(self) -> dict:
+        os_name, os_version = self._get_os_release()
+        os_kernel, os_architecture = self._get_uname()
+        return {
+            "hostname": self._hostname,
+            # boot time, despite the key name
+            "uptime": self._get_boot_time(),
+            "memory_max": self._get_memory_max(),
+            "os_name": os_name,
+            "os_version": os_version,
+            "os_kernel": os_kernel,
+            "os_architecture": os_architecture,
+            "cpu_model": self._get_cpu_model(),
+        }
 
-        try:
-            uname = platform.uname()
-            os_kernel = uname.release or ""
-            os_architecture = uname.machine or ""
-        except Exception:
-            os_kernel = ""
-            os_architecture = ""
+    def _collect_live(self) -> dict:
+        # the probes are mostly sleeping or waiting on I/O, run them side by side
+        ip_f = self._executor.submit(self._get_ip)
+        cpu_f = self._executor.submit(self._get_cpu_usage_freq)
+        gpu_f = self._executor.submit(self._get_gpu)
+        temp_f = self._executor.submit(self._get_cpu_temperature)
+        proc_f = self._executor.submit(self._get_processes)
+        disk_f = self._executor.submit(self._get_disks)
 
-        # cpu model from /proc/cpuinfo
-        cpu_model = ""
+        # memory
+        memory_usage = 0.0
         try:
-            if os.path.exists("/proc/cpuinfo"):
-                with open("/proc/cpuinfo", "r") as fh:
-                    for line in fh:
-                        if line.lower().startswith("model name") or line.lower().startswith("cpu model"):
-                            parts = line.split(":", 1)
-                            if len(parts) == 2:
-                                cpu_model = parts[1].strip()
-                                break
-                if not cpu_model:
-                    # fallback: first "vendor_id" + "model"
-                    with open("/proc/cpuinfo", "r") as fh:
-                        txt = fh.read()
-                    m = re.search(r"model name\s*:\s*(.+)", txt)
-                    if m:
-                        cpu_model = m.group(1).strip()
+            if psutil:
+                memory_usage = float(psutil.virtual_memory().percent)
         except Exception:
-            cpu_model = ""
+            memory_usage = 0.0
+
+        # resolve every value into a local first so the result is built in a
+        # single dict literal without per-key conversions
+        cpu_usage, cpu_frequency = cpu_f.result()
+        if cpu_usage is None:
+            cpu_usage = 0.0
+        cpu_frequency = int(cpu_frequency) if cpu_frequency is not None else 0
+        cpu_temperature = temp_f.result()
+        if cpu_temperature is None:
+            cpu_temperature = 0.0
+        gpu_usage, gpu_frequency, gpu_temperature, gpu_model = gpu_f.result()
+        if gpu_usage is None:
+            gpu_usage = 0.0
+        if gpu_frequency is None:
+            gpu_frequency = 0.0
+        if gpu_temperature is None:
+            gpu_temperature = 0.0
 
         return {
-            "hostname": hostname,
-            "ip": ip,
-            "uptime": int(psutil.boot_time()) if psutil else 0,
-            "cpu_usage": float(cpu_usage) if cpu_usage is not None else 0.0,
-            "cpu_frequency": int(cpu_frequency) if cpu_frequency is not None else 0,
-            "gpu_usage": float(gpu_usage) if gpu_usage is not None else 0.0,
-            "gpu_frequency": float(gpu_frequency) if gpu_frequency is not None else 0.0,
-            "cpu_temperature": float(cpu_temperature) if cpu_temperature is not None else 0.0,
-            "gpu_temperature": float(gpu_temperature) if gpu_temperature is not None else 0.0,
-            "memory_usage": float(memory_usage) if memory_usage is not None else 0,
-            "memory_max": int(memory_max) if memory_max is not None else 0,
-            "disks": disks,
-            "processes": processes,
-            "os_name": os_name,
-            "os_version": os_version,
-            "os_kernel": os_kernel,
-            "os_architecture": os_architecture,
-            "cpu_model": cpu_model,
+            "ip": ip_f.result(),
+            "cpu_usage": cpu_usage,
+            "cpu_frequency": cpu_frequency,
+            "gpu_usage": gpu_usage,
+            "gpu_frequency": gpu_frequency,
+            "cpu_temperature": cpu_temperature,
+            "gpu_temperature": gpu_temperature,
+            "memory_usage": memory_usage,
+            "disks": disk_f.result(),
+            "processes": proc_f.result(),
             "gpu_model": gpu_model,
-        }
\ No newline at end of file
+        }
+
+    def gather_info(self) -> dict:
+        return {**self._static, **self._collect_live()}
@@ -1,27 +1,109 @@
 import os
+import gzip
+import json
+import queue
 import requests
+import threading
 import time
+from functools import lru_cache
 from typing import Dict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except Exception:
+    httpx = None
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except Exception:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
 
 #local imports
 from importlib import import_module
 from windows.windows import Windows
 from linux.linux import Linux
 
+_HEADERS = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+
+def make_session():
+    # one keep-alive connection reused for every post instead of a new
+    # TCP/TLS handshake per iteration. Prefer an HTTP/2 httpx client when
+    # httpx and h2 are installed, otherwise a requests session whose
+    # retries back off on a dead endpoint.
+    if httpx:
+        try:
+            transport = httpx.HTTPTransport(http2=True, retries=3)
+            return httpx.Client(http2=True, transport=transport, timeout=5.0, headers=_HEADERS)
+        except ImportError:
+            pass
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504), allowed_methods=None)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(_HEADERS)
+    return session
+
+SESSION = make_session()
+
 def main():
     os_info = get_os_info()
     print(f"Operating System Name: {os_info['name']}")
     print(f"Platform: {os_info['platform']}")
 
     endpoint = os.getenv("ENDPOINT_URL", "http://localhost:8080/hosts")
+    interval = float(os.getenv("POLL_INTERVAL", "1"))
+
+    # posting happens on a background thread so a slow server does not delay
+    # the next sample; the queue is bounded and drops the oldest payload
+    outbox = queue.Queue(maxsize=4)
+    threading.Thread(target=sender, args=(endpoint, outbox), daemon=True).start()
+
+    next_run = time.monotonic()
     while True:
         info = call_sysinfocollection(os_info)
-        print(info)
-        response = requests.post(endpoint, json=info)
-        if response.status_code == 200:
-            print("Sysinfo successfully sent to the server.")
+        # serialize once and reuse the bytes for both the log line and the post
+        payload = _dumps(info)
+        print(payload.decode())
+        try:
+            outbox.put_nowait(payload)
+        except queue.Full:
+            try:
+                outbox.get_nowait()
+            except queue.Empty:
+                pass
+            outbox.put_nowait(payload)
+
+        # schedule against the monotonic clock so collection time doesn't drift
+        next_run += interval
+        delay = next_run - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
         else:
-            print(f"Failed to send sysinfo. Status code: {response.status_code}")
+            next_run = time.monotonic()
+
+def sender(endpoint: str, outbox: queue.Queue) -> None:
+    while True:
+        send_sysinfo(endpoint, outbox.get())
+
+def send_sysinfo(endpoint: str, payload: bytes) -> None:
+    body = gzip.compress(payload, compresslevel=1)
+    try:
+        if isinstance(SESSION, requests.Session):
+            response = SESSION.post(endpoint, data=body, timeout=5)
+        else:
+            response = SESSION.post(endpoint, content=body)
+    except Exception as e:
+        print(f"Failed to send sysinfo: {e}")
+        return
+    if response.status_code == 200:
+        print("Sysinfo successfully sent to the server.")
+    else:
+        print(f"Failed to send sysinfo. Status code: {response.status_code}")
 
 def get_os_info():
     return {
@@ -29,17 +111,24 @@ def get_os_info():
         "platform": os.sys.platform
     }
 
-def call_sysinfocollection(os_info: Dict) -> None:
-    # Placeholder for future implementation
-    match os_info['platform']:
+@lru_cache(maxsize=None)
+def get_collector(platform: str):
+    # collectors cache static host info on init, so keep one per platform
+    match platform:
         case "linux":
-            print("Collecting sysinfo for Linux...")
-            return Linux().gather_info()
+            return Linux()
         case "win32":
-            print("Collecting sysinfo for Windows...")
-            return Windows().gather_info()
+            return Windows()
         case _:
-            print("Unknown or Unsupported platform")
+            return None
+
+def call_sysinfocollection(os_info: Dict) -> None:
+    collector = get_collector(os_info['platform'])
+    if collector is None:
+        print("Unknown or Unsupported platform")
+        return None
+    print(f"Collecting sysinfo for {type(collector).__name__}...")
+    return collector.gather_info()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,9 +1,17 @@
 import os
+import atexit
+import copy
+import ctypes
 import re
+import heapq
 import socket
 import platform
 import subprocess
-from typing import Optional, List, Dict, Any
+import threading
+import types
+from functools import cached_property
+import time
+from typing import Optional, List, Dict, Any, Callable
 
 try:
     import psutil
@@ -20,18 +28,176 @@ try:
 except Exception:
     wmi = None
 
+try:
+    import win32com.client
+except Exception:
+    win32com = None
+
+try:
+    import pynvml
+except Exception:
+    pynvml = None
+
+try:
+    import winreg
+except Exception:
+    winreg = None
+
+_CPU_REG_PATH = r"HARDWARE\DESCRIPTION\System\CentralProcessor\0"
+_CPU_REG_VALUES = frozenset({"ProcessorNameString"})
+
+# consecutive empty results before the remembered GPU backend is re-probed
+_GPU_BACKEND_MAX_MISSES = 3
+
+# OS metadata is constant for the process, resolve it once at import
+_UNAME = platform.uname()
+
+# seconds a resolved IP address is reused
+_IP_TTL = 30.0
+
+# seconds between disk_partitions() refreshes
+_PARTITIONS_TTL = 60.0
+
+# stand-in for processes whose memory_info could not be read
+_ZERO_MEM = types.SimpleNamespace(rss=0)
+
+
+def _open_registry_cpu_key():
+    # resolve the CPU key once at import and keep the handle for the life of
+    # the process, so reads don't pay RegOpenKeyEx/RegCloseKey each time
+    if not winreg:
+        return None
+    # try the native 64-bit view first, then the default view
+    for access in (winreg.KEY_READ | winreg.KEY_WOW64_64KEY, winreg.KEY_READ):
+        try:
+            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _CPU_REG_PATH, 0, access)
+        except OSError:
+            continue
+        atexit.register(winreg.CloseKey, key)
+        return key
+    return None
+
+
+_REG_CPU_HKEY = _open_registry_cpu_key()
+
+
+def _enum_registry_cpu_values(key) -> Dict[str, Any]:
+    # one enumeration pass instead of a QueryValueEx per value
+    values = {}
+    i = 0
+    while True:
+        try:
+            name, val, _ = winreg.EnumValue(key, i)
+        except OSError:
+            break
+        if name in _CPU_REG_VALUES:
+            values[name] = val
+            if len(values) == len(_CPU_REG_VALUES):
+                break
+        i += 1
+    return values
+
+
+def _read_registry_cpu_brand() -> Optional[str]:
+    if _REG_CPU_HKEY is None:
+        return None
+    try:
+        values = _enum_registry_cpu_values(_REG_CPU_HKEY)
+    except OSError:
+        return None
+    brand = values.get("ProcessorNameString")
+    return (str(brand).strip() or None) if brand else None
+
+
+try:
+    _kernel32 = ctypes.windll.kernel32
+except Exception:
+    _kernel32 = None
+
+
+def _read_system_times() -> Optional[tuple]:
+    # (idle, kernel, user) in 100ns ticks straight from kernel32; each
+    # FILETIME is read as one 64-bit integer
+    if _kernel32 is None:
+        return None
+    idle, kernel, user = ctypes.c_ulonglong(), ctypes.c_ulonglong(), ctypes.c_ulonglong()
+    try:
+        if not _kernel32.GetSystemTimes(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user)):
+            return None
+    except Exception:
+        return None
+    return idle.value, kernel.value, user.value
+
 
 class Windows:
     def __init__(self):
-        # keep a WMI client if available to reduce repeated init cost
-        self._wmi_client = None
+        # keep a root\cimv2 WBEM connection if available to reduce repeated
+        # init cost; queries SELECT only the columns we use, which is much
+        # cheaper than wmi.WMI() fetching every property of each class
+        self._wbem = None
+        if win32com:
+            try:
+                locator = win32com.client.Dispatch("WbemScripting.SWbemLocator")
+                self._wbem = locator.ConnectServer(".", "root\\cimv2")
+            except Exception:
+                self._wbem = None
+        # OpenHardwareMonitor namespace for CPU temperatures, connected once
+        self._ohm_client = None
         if wmi:
             try:
-                self._wmi_client = wmi.WMI()
+                self._ohm_client = wmi.WMI(namespace="root\\OpenHardwareMonitor")
+            except Exception:
+                self._ohm_client = None
+
+        # NVML handle for GPU telemetry without spawning nvidia-smi per call
+        self._nvml_handle = None
+        if pynvml:
+            try:
+                pynvml.nvmlInit()
+                atexit.register(pynvml.nvmlShutdown)
+                self._nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
             except Exception:
-                self._wmi_client = None
+                self._nvml_handle = None
+
+        # (timestamp, result) of the last collection, see gather_info
+        self._snapshot_lock = threading.Lock()
+        self._snapshot = (0.0, None)
+
+        # (timestamp, ip) from the last _get_ip() lookup
+        self._ip_cache = (None, "127.0.0.1")
+
+        # (timestamp, partitions) from the last disk_partitions() call
+        self._partitions_cache = (None, [])
+
+        # GPU backend that produced data last time, see _get_gpu_info
+        self._gpu_backend: Optional[Callable[[], Dict[str, Any]]] = None
+        self._gpu_misses = 0
+
+        # boot time never changes while we run (reported as "uptime")
+        self._boot_time: Optional[int] = None
+        if psutil:
+            try:
+                self._boot_time = int(psutil.boot_time())
+            except Exception:
+                self._boot_time = None
+
+        # prime psutil's cpu_percent baseline so samples never have to block
+        self._last_cpu_pct: Optional[float] = None
+        self._last_cpu_pct_ts = time.monotonic()
+        if psutil:
+            try:
+                psutil.cpu_percent(interval=None)
+            except Exception:
+                pass
+        # same for the GetSystemTimes fast path
+        self._last_system_times = _read_system_times()
 
     def _get_ip(self, hostname: str) -> str:
+        # the outgoing address rarely changes; reuse it for _IP_TTL seconds
+        ts, ip = self._ip_cache
+        now = time.monotonic()
+        if ts is not None and now - ts < _IP_TTL:
+            return ip
         ip = "127.0.0.1"
         try:
             s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -47,33 +213,96 @@ class Windows:
                 ip = socket.gethostbyname(hostname)
             except Exception:
                 ip = "127.0.0.1"
+        self._ip_cache = (now, ip)
         return ip
 
-    def _get_cpu_model(self) -> str:
+    def _get_cpu_usage(self) -> Optional[float]:
+        # non-blocking usage since the previous sample. Calls less than 100ms
+        # apart get the cached value, since a shorter delta is mostly noise
+        # (the first call right after __init__ therefore returns None).
+        now = time.monotonic()
+        if now - self._last_cpu_pct_ts < 0.1:
+            return self._last_cpu_pct
+        pct = self._get_cpu_usage_from_system_times()
+        if pct is None and psutil:
+            pct = float(psutil.cpu_percent(interval=None))
+        self._last_cpu_pct = pct
+        self._last_cpu_pct_ts = now
+        return self._last_cpu_pct
+
+    def _get_cpu_usage_from_system_times(self) -> Optional[float]:
+        # system-wide usage from the GetSystemTimes delta; kernel time
+        # includes idle time, so busy = kernel + user - idle
+        times = _read_system_times()
+        if times is None:
+            return None
+        prev, self._last_system_times = self._last_system_times, times
+        if prev is None:
+            return None
+        idle = times[0] - prev[0]
+        total = (times[1] - prev[1]) + (times[2] - prev[2])
+        if total <= 0:
+            return None
+        return 100.0 * (total - idle) / total
+
+    def _wbem_first(self, wql: str):
+        # first row of a WQL query against root\cimv2, None without WBEM
+        if self._wbem is None:
+            return None
+        for item in self._wbem.ExecQuery(wql):
+            return item
+        return None
+
+    @cached_property
+    def _hostname(self) -> str:
+        return _UNAME.node or ""
+
+    @cached_property
+    def _os_info(self) -> tuple:
+        # OS info - try WMI for friendly name, fallback to platform
+        os_name = ""
+        os_version = ""
+        os_kernel = ""
+        os_architecture = ""
         try:
+            os_item = self._wbem_first("SELECT Caption, Version FROM Win32_OperatingSystem")
+            if os_item is not None:
+                os_name = getattr(os_item, "Caption", "") or ""
+                os_version = getattr(os_item, "Version", "") or ""
+        except Exception:
+            pass
+        os_kernel = _UNAME.release or ""
+        os_architecture = _UNAME.machine or ""
+        if not os_name:
+            os_name = _UNAME.system or ""
+        if not os_version:
+            os_version = _UNAME.version or ""
+        return os_name, os_version, os_kernel, os_architecture
+
+    @cached_property
+    def _cpu_model(self) -> str:
+        try:
+            # registry read is much cheaper than a WMI query
+            brand = _read_registry_cpu_brand()
+            if brand:
+                return brand
             # prefer WMI if available (gives friendly CPU name)
-            if self._wmi_client:
-                try:
-                    procs = self._wmi_client.Win32_Processor()
-                    if procs:
-                        name = getattr(procs[0], "Name", None)
-                        if name:
-                            return str(name)
-                except Exception:
-                    pass
+            try:
+                proc = self._wbem_first("SELECT Name FROM Win32_Processor")
+                name = getattr(proc, "Name", None) if proc is not None else None
+                if name:
+                    return str(name)
+            except Exception:
+                pass
             # fallback to platform
-            proc = platform.processor()
-            if proc:
-                return proc
-            uname_proc = getattr(platform.uname(), "processor", None)
-            if uname_proc:
-                return uname_proc
+            if _UNAME.processor:
+                return _UNAME.processor
         except Exception:
             pass
         return ""
 
     def _get_cpu_temperature(self) -> Optional[float]:
-        # best-effort: psutil sensors, then WMI (MSAcpi_ThermalZoneTemperature)
+        # best-effort: psutil sensors, then OpenHardwareMonitor via WMI
         try:
             if psutil and hasattr(psutil, "sensors_temperatures"):
                 temps = psutil.sensors_temperatures(fahrenheit=False)
@@ -90,20 +319,39 @@ class Windows:
         except Exception:
             pass
 
-        if self._wmi_client:
+        if self._ohm_client:
             try:
-                # namespace root\WMI MSAcpi_ThermalZoneTemperature (tenths of Kelvin)
-                c = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-                temperature_infos = c.Sensor()
-                for sensor in temperature_infos:
-                    if sensor.SensorType==u'Temperature':
-                        temp_c = float(sensor.Value)
-                        print(temp_c)
+                # OpenHardwareMonitor sensors, e.g. "CPU Package" / "CPU Core #1"
+                for sensor in self._ohm_client.Sensor():
+                    if sensor.SensorType == u'Temperature' and "CPU" in (sensor.Name or ""):
+                        return float(sensor.Value)
             except Exception:
                 pass
 
         return None
 
+    def _get_gpu_via_nvml(self) -> Dict[str, Optional[float or str]]:
+        info = {"usage": None, "frequency": None, "temperature": None, "model": None}
+        try:
+            info["usage"] = float(pynvml.nvmlDeviceGetUtilizationRates(self._nvml_handle).gpu)
+        except Exception:
+            pass
+        try:
+            info["frequency"] = float(pynvml.nvmlDeviceGetClockInfo(self._nvml_handle, pynvml.NVML_CLOCK_GRAPHICS))
+        except Exception:
+            pass
+        try:
+            info["temperature"] = float(pynvml.nvmlDeviceGetTemperature(self._nvml_handle, pynvml.NVML_TEMPERATURE_GPU))
+        except Exception:
+            pass
+        try:
+            name = pynvml.nvmlDeviceGetName(self._nvml_handle)
+            # older pynvml releases return bytes
+            info["model"] = (name.decode(errors="ignore") if isinstance(name, bytes) else str(name)) or None
+        except Exception:
+            pass
+        return info
+
     def _get_gpu_via_nvidia_smi(self) -> Dict[str, Optional[float or str]]:
         info = {"usage": None, "frequency": None, "temperature": None, "model": None}
         try:
@@ -156,19 +404,69 @@ class Windows:
 
     def _get_gpu_via_wmi(self) -> Dict[str, Optional[float or str]]:
         info = {"usage": None, "frequency": None, "temperature": None, "model": None}
-        if self._wmi_client:
-            try:
-                controllers = self._wmi_client.Win32_VideoController()
-                if controllers:
-                    name = getattr(controllers[0], "Name", None)
-                    info["model"] = str(name) if name else None
-            except Exception:
-                pass
+        try:
+            controller = self._wbem_first("SELECT Name FROM Win32_VideoController")
+            if controller is not None:
+                name = getattr(controller, "Name", None)
+                info["model"] = str(name) if name else None
+        except Exception:
+            pass
         return info
 
-    def gather_info(self) -> Dict[str, Any]:
-        # hostname
-        hostname = platform.node() or ""
+    def _get_partitions(self) -> list:
+        # drive topology rarely changes, so re-enumerate at most every
+        # _PARTITIONS_TTL seconds; only fixed drives are kept so optical and
+        # removable drives are never probed (or spun up) by disk_usage
+        ts, parts = self._partitions_cache
+        now = time.monotonic()
+        if ts is None or now - ts > _PARTITIONS_TTL:
+            parts = [
+                p for p in psutil.disk_partitions(all=False)
+                if p.fstype.lower() != "cdfs" and "fixed" in p.opts
+            ]
+            self._partitions_cache = (now, parts)
+        return parts
+
+    def _get_gpu_info(self) -> Dict[str, Optional[float or str]]:
+        # stick with the backend that answered last time; after a few results
+        # in a row without telemetry (e.g. GPU removed, or only the WMI model
+        # name) probe the whole chain again
+        if self._gpu_backend is not None:
+            info = self._gpu_backend()
+            if any(info[k] is not None for k in ("usage", "frequency", "temperature")):
+                self._gpu_misses = 0
+                return info
+            self._gpu_misses += 1
+            if self._gpu_misses < _GPU_BACKEND_MAX_MISSES:
+                if info["model"] is None:
+                    info["model"] = self._get_gpu_via_wmi()["model"]
+                return info
+            self._gpu_backend = None
+            self._gpu_misses = 0
+
+        # try NVML (nvidia-smi without it), then GPUtil, then WMI for the model
+        nvidia = self._get_gpu_via_nvml if self._nvml_handle is not None else self._get_gpu_via_nvidia_smi
+        for backend in (nvidia, self._get_gpu_via_gputil):
+            info = backend()
+            if any(v is not None for v in info.values()):
+                self._gpu_backend = backend
+                return info
+        self._gpu_backend = self._get_gpu_via_wmi
+        return self._gpu_backend()
+
+    def gather_info(self, ttl: float = 0.25) -> Dict[str, Any]:
+        # callers on several threads share one snapshot: the first caller
+        # after the TTL expires collects, the others get a deep copy of its result
+        # instead of sampling again (and clobbering the cpu usage baseline)
+        with self._snapshot_lock:
+            ts, snapshot = self._snapshot
+            if snapshot is None or time.monotonic() - ts >= ttl:
+                snapshot = self._collect_info()
+                self._snapshot = (time.monotonic(), snapshot)
+            return copy.deepcopy(snapshot)
+
+    def _collect_info(self) -> Dict[str, Any]:
+        hostname = self._hostname
 
         # ip
         ip = self._get_ip(hostname)
@@ -177,12 +475,10 @@ class Windows:
         cpu_usage: Optional[float] = None
         cpu_frequency: Optional[float] = None
         try:
+            cpu_usage = self._get_cpu_usage()
             if psutil:
-                cpu_usage = float(psutil.cpu_percent(interval=0.5))
                 cpu_freq = psutil.cpu_freq()
                 cpu_frequency = float(cpu_freq.current) if cpu_freq and cpu_freq.current else None
-            else:
-                cpu_usage = None
         except Exception:
             cpu_usage = None
             cpu_frequency = None
@@ -190,20 +486,10 @@ class Windows:
         # cpu temperature
         cpu_temperature = self._get_cpu_temperature()
 
-        # GPU info - try nvidia-smi, then GPUtil, then WMI model-only fallback
+        # GPU info
         gpu_info = {"usage": None, "frequency": None, "temperature": None, "model": None}
         try:
-            nv = self._get_gpu_via_nvidia_smi()
-            if any(v is not None for v in nv.values()):
-                gpu_info = nv
-            else:
-                gu = self._get_gpu_via_gputil()
-                if any(v is not None for v in gu.values()):
-                    gpu_info = gu
-                else:
-                    wi = self._get_gpu_via_wmi()
-                    if any(v is not None for v in wi.values()):
-                        gpu_info = wi
+            gpu_info = self._get_gpu_info()
         except Exception:
             pass
 
@@ -239,7 +525,7 @@ class Windows:
             try:
                 seen = {os.path.normcase(os.path.normpath(partition))}
                 if psutil:
-                    for p in psutil.disk_partitions(all=False):
+                    for p in self._get_partitions():
                         try:
                             mp = p.mountpoint
                             if not mp:
@@ -278,56 +564,26 @@ class Windows:
         processes: List[str] = []
         try:
             if psutil:
-                procs = []
-                for p in psutil.process_iter(attrs=["name", "pid", "memory_info"]):
-                    try:
-                        info = p.info
-                        meminfo = info.get("memory_info")
-                        rss = meminfo.rss if meminfo else 0
-                        name = info.get("name") or f"pid:{info.get('pid')}"
-                        procs.append((rss, f"{name} ({info.get('pid')})"))
-                    except Exception:
-                        continue
-                procs.sort(key=lambda x: x[0], reverse=True)
-                processes = [p[1] for p in procs[:10]]
+                # partial sort through a size-10 heap instead of sorting every process
+                # ad_value fills protected attributes with None instead of
+                # raising AccessDenied for every system process
+                top = heapq.nlargest(
+                    10,
+                    psutil.process_iter(attrs=("pid", "name", "memory_info"), ad_value=None),
+                    key=lambda p: (p.info["memory_info"] or _ZERO_MEM).rss,
+                )
+                for p in top:
+                    pid = p.info["pid"]
+                    processes.append(f"{p.info['name'] or f'pid:{pid}'} ({pid})")
         except Exception:
             processes = []
 
-        # OS info - try WMI for friendly name, fallback to platform
-        os_name = ""
-        os_version = ""
-        os_kernel = ""
-        os_architecture = ""
-        try:
-            if self._wmi_client:
-                try:
-                    os_items = self._wmi_client.Win32_OperatingSystem()
-                    if os_items:
-                        os_name = getattr(os_items[0], "Caption", "") or ""
-                        os_version = getattr(os_items[0], "Version", "") or ""
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        try:
-            uname = platform.uname()
-            os_kernel = uname.release or ""
-            os_architecture = uname.machine or ""
-            if not os_name:
-                os_name = platform.system() or ""
-            if not os_version:
-                os_version = platform.version() or ""
-        except Exception:
-            os_kernel = ""
-            os_architecture = ""
-
-        # cpu model
-        cpu_model = self._get_cpu_model()
+        os_name, os_version, os_kernel, os_architecture = self._os_info
 
         res =  {
             "hostname": hostname,
             "ip": ip,
-            "uptime": int(psutil.boot_time()) if psutil else None,
+            "uptime": self._boot_time,
             "cpu_usage": float(cpu_usage) if cpu_usage is not None else None,
             "cpu_frequency": float(cpu_frequency) if cpu_frequency is not None else None,
             "gpu_usage": float(gpu_usage) if gpu_usage is not None else None,
@@ -342,7 +598,7 @@ class Windows:
             "os_version": os_version,
             "os_kernel": os_kernel,
             "os_architecture": os_architecture,
-            "cpu_model": cpu_model,
+            "cpu_model": self._cpu_model,
             "gpu_model": gpu_model,
         }
         return res
\ No newline at end of file